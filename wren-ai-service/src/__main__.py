@@ -1,14 +1,15 @@
-import logging
-import os
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import ORJSONResponse, RedirectResponse
 from langfuse.decorators import langfuse_context
+from starlette.routing import Route
 
+from src.config import settings
 from src.globals import (
     create_service_container,
     create_service_metadata,
@@ -21,46 +22,28 @@ from src.utils import (
 )
 from src.web.v1 import routers
 
+# load .env.dev overrides before the first settings() access so the cached
+# Settings see them
 env = load_env_vars()
-setup_custom_logger(
-    "wren-ai-service",
-    level=(
-        logging.DEBUG if os.getenv("LOGGING_LEVEL", "INFO") == "DEBUG" else logging.INFO
-    ),
-)
+setup_custom_logger("wren-ai-service", level=settings().logging_level)
 
 
 # https://fastapi.tiangolo.com/advanced/events/#lifespan
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # startup events
-    pipe_components = generate_components(force_deploy=os.getenv("SHOULD_FORCE_DEPLOY"))
+    config = settings()
+    pipe_components = generate_components(force_deploy=config.should_force_deploy)
     app.state.service_container = create_service_container(
         pipe_components,
-        column_indexing_batch_size=(
-            int(os.getenv("COLUMN_INDEXING_BATCH_SIZE"))
-            if os.getenv("COLUMN_INDEXING_BATCH_SIZE")
-            else 50
-        ),
-        table_retrieval_size=(
-            int(os.getenv("TABLE_RETRIEVAL_SIZE"))
-            if os.getenv("TABLE_RETRIEVAL_SIZE")
-            else 10
-        ),
-        table_column_retrieval_size=(
-            int(os.getenv("TABLE_COLUMN_RETRIEVAL_SIZE"))
-            if os.getenv("TABLE_COLUMN_RETRIEVAL_SIZE")
-            else 1000
-        ),
+        column_indexing_batch_size=config.column_indexing_batch_size,
+        table_retrieval_size=config.table_retrieval_size,
+        table_column_retrieval_size=config.table_column_retrieval_size,
         query_cache={
-            # the maxsize is a necessary parameter to init cache, but we don't want to expose it to the user
-            # so we set it to 1_000_000, which is a large number
-            "maxsize": 1_000_000,
-            "ttl": int(os.getenv("QUERY_CACHE_TTL") or 120),
+            "maxsize": config.query_cache_maxsize,
+            "ttl": config.query_cache_ttl,
         },
-        allow_using_db_schemas_without_pruning=bool(
-            os.getenv("ALLOW_USING_DB_SCHEMAS_WITHOUT_PRUNING", False)
-        ),
+        allow_using_db_schemas_without_pruning=config.allow_using_db_schemas_without_pruning,
     )
     app.state.service_metadata = create_service_metadata(pipe_components)
     init_langfuse()
@@ -85,6 +68,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# compress large JSON responses (e.g. ask results with long SQL statements);
+# minimum_size keeps tiny payloads like /health uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 app.include_router(routers.router, prefix="/v1", tags=["v1"])
 if env == "dev":
     from src.web import development
@@ -113,28 +99,32 @@ def root():
     return RedirectResponse(url="/docs")
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok"}
+# liveness probes hit /health every few seconds, so it bypasses FastAPI's
+# dependency/serialization stack: a bare Starlette route returning a
+# precomputed response costs little more than the route-table lookup
+_HEALTH_RESPONSE = ORJSONResponse({"status": "ok"})
 
 
-if __name__ == "__main__":
-    server_host = os.getenv("WREN_AI_SERVICE_HOST") or "127.0.0.1"
-    server_port = (
-        int(os.getenv("WREN_AI_SERVICE_PORT"))
-        if os.getenv("WREN_AI_SERVICE_PORT") is not None
-        else 8000
-    )
+async def health(request):
+    return _HEALTH_RESPONSE
+
 
+app.router.routes.append(Route("/health", health))
+
+
+if __name__ == "__main__":
+    config = settings()
     should_reload = env == "dev"
 
+    # workers defaults to 1: query results live in in-process TTL caches,
+    # so running more workers requires sticky routing in front of the service
     uvicorn.run(
         "src.__main__:app",
-        host=server_host,
-        port=server_port,
+        host=config.host,
+        port=config.port,
         reload=should_reload,
         reload_includes=["src/**/*.py", ".env.dev", "config.yaml"],
-        workers=1,
+        workers=config.workers,
         loop="uvloop",
         http="httptools",
     )
@@ -0,0 +1,65 @@
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Typed server settings read from the environment once at first access.
+
+    Every os.getenv call walks the process environment dict and the int()
+    conversions reparse the same strings; the startup path did both
+    repeatedly. Parsing everything here a single time centralizes the
+    defaults and keeps the rest of the code on typed attributes.
+    """
+
+    logging_level: int
+    host: str
+    port: int
+    workers: int
+    should_force_deploy: Optional[str]
+    column_indexing_batch_size: int
+    table_retrieval_size: int
+    table_column_retrieval_size: int
+    query_cache_maxsize: int
+    query_cache_ttl: int
+    allow_using_db_schemas_without_pruning: bool
+
+
+def _int_env(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+@lru_cache
+def settings() -> Settings:
+    """
+    Build the Settings once and memoize them for the process lifetime.
+
+    Call load_env_vars() before the first access so .env.dev overrides are
+    already applied when the environment is read.
+    """
+    return Settings(
+        logging_level=(
+            logging.DEBUG
+            if os.getenv("LOGGING_LEVEL", "INFO") == "DEBUG"
+            else logging.INFO
+        ),
+        host=os.getenv("WREN_AI_SERVICE_HOST") or "127.0.0.1",
+        port=_int_env("WREN_AI_SERVICE_PORT", 8000),
+        workers=_int_env("WREN_AI_SERVICE_WORKERS", 1),
+        should_force_deploy=os.getenv("SHOULD_FORCE_DEPLOY"),
+        column_indexing_batch_size=_int_env("COLUMN_INDEXING_BATCH_SIZE", 50),
+        table_retrieval_size=_int_env("TABLE_RETRIEVAL_SIZE", 10),
+        table_column_retrieval_size=_int_env("TABLE_COLUMN_RETRIEVAL_SIZE", 1000),
+        # the maxsize is a necessary parameter to init cache, but we don't want
+        # to expose it to the user, so we set it to 1_000_000, which is a large number
+        query_cache_maxsize=1_000_000,
+        query_cache_ttl=_int_env("QUERY_CACHE_TTL", 120),
+        allow_using_db_schemas_without_pruning=bool(
+            os.getenv("ALLOW_USING_DB_SCHEMAS_WITHOUT_PRUNING", False)
+        ),
+    )
@@ -1,13 +1,16 @@
 import asyncio
-import json
+import hashlib
 import logging
 import os
+import re
 import sys
 import uuid
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import orjson
+from cachetools import LRUCache
 from hamilton import base
 from hamilton.experimental.h_async import AsyncDriver
 from hamilton.function_modifiers import extract_fields
@@ -23,7 +26,27 @@ from src.utils import async_timer, timer
 
 logger = logging.getLogger("wren-ai-service")
 
-DATASET_NAME = os.getenv("DATASET_NAME")
+# shared orjson.dumps options: sorted keys keep the serialized MDL (and thus the
+# cache digests derived from it) deterministic regardless of dict insertion order
+_DUMPS_OPTS = orjson.OPT_SORT_KEYS
+
+
+# matches relationship conditions of the canonical "table.column = table.column"
+# shape so both FK column names come out of a single precompiled match
+_CONDITION_PATTERN = re.compile(r"(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)")
+
+# dbschema documents are embedded and written in slices of this size so the
+# write of one slice overlaps the embedding of the next instead of holding
+# every embedded document before the first write starts
+_EMBED_WRITE_BATCH_SIZE = 64
+
+
+def _progress(iterable, desc: str):
+    # tqdm writes to stderr and times every iteration; that's noise in server
+    # logs and measurable overhead on large MDLs, so progress bars are opt-in
+    if os.getenv("WREN_PROGRESS") == "1":
+        return tqdm(iterable, desc=desc)
+    return iterable
 
 
 @component
@@ -37,7 +60,7 @@ class DocumentCleaner:
         self._stores = stores
 
     @component.output_types(mdl=str)
-    async def run(self, mdl: str, id: Optional[str] = None) -> str:
+    async def run(self, mdl: str, id: Optional[str] = None) -> Dict[str, str]:
         async def _clear_documents(
             store: DocumentStore, id: Optional[str] = None
         ) -> None:
@@ -51,10 +74,12 @@ class DocumentCleaner:
                 if id
                 else None
             )
+            # a single server-side bulk delete: the store translates the filter
+            # (or its absence) into one delete call instead of deleting by id
             await store.delete_documents(filters)
 
         logger.info("Ask Indexing pipeline is clearing old documents...")
-        await asyncio.gather(*[_clear_documents(store, id) for store in self._stores])
+        await asyncio.gather(*(_clear_documents(store, id) for store in self._stores))
         return {"mdl": mdl}
 
 
@@ -65,20 +90,14 @@ class MDLValidator:
     """
 
     @component.output_types(mdl=Dict[str, Any])
-    def run(self, mdl: str) -> str:
+    def run(self, mdl: str) -> Dict[str, Any]:
         try:
             mdl_json = orjson.loads(mdl)
             logger.debug(f"MDL JSON: {mdl_json}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
-        if "models" not in mdl_json:
-            mdl_json["models"] = []
-        if "views" not in mdl_json:
-            mdl_json["views"] = []
-        if "relationships" not in mdl_json:
-            mdl_json["relationships"] = []
-        if "metrics" not in mdl_json:
-            mdl_json["metrics"] = []
+        for key in ("models", "views", "relationships", "metrics"):
+            mdl_json.setdefault(key, [])
 
         return {"mdl": mdl_json}
 
@@ -113,22 +132,19 @@ class ViewChunker:
                 "viewId": properties.get("viewId", ""),
             }
 
-        converted_views = [
-            {"content": _get_content(view), "meta": _get_meta(view)}
-            for view in mdl["views"]
-        ]
-
+        # build the Document per view directly instead of materializing an
+        # intermediate list of {content, meta} dicts first
         return {
             "documents": [
                 Document(
                     id=str(uuid.uuid4()),
-                    meta={"project_id": id, **converted_view["meta"]}
+                    meta={"project_id": id, **_get_meta(view)}
                     if id
-                    else {**converted_view["meta"]},
-                    content=converted_view["content"],
+                    else _get_meta(view),
+                    content=_get_content(view),
                 )
-                for converted_view in tqdm(
-                    converted_views,
+                for view in _progress(
+                    mdl["views"],
                     desc="indexing view into the historical view question store",
                 )
             ]
@@ -170,7 +186,7 @@ class DDLConverter:
                     ),
                     content=ddl_command["payload"],
                 )
-                for ddl_command in tqdm(
+                for ddl_command in _progress(
                     ddl_commands,
                     desc="indexing ddl commands into the dbschema store",
                 )
@@ -236,88 +252,125 @@ class DDLConverter:
         # A map to store model primary keys for foreign key relationships
         primary_keys_map = {model["name"]: model["primaryKey"] for model in models}
 
+        # parse each relationship once and index it under both endpoint models,
+        # so the per-model loop only visits the relationships that involve the
+        # model instead of scanning the whole list (O(models + relationships)
+        # rather than O(models x relationships))
+        relationships_by_model = defaultdict(list)
+        for relationship in relationships:
+            related_models = relationship.get("models", [])
+            if len(related_models) != 2:
+                continue
+
+            join_type = relationship.get("joinType", "")
+            # only these join types emit FOREIGN KEY constraints below; other
+            # ones (e.g. MANY_TO_MANY) never had their condition parsed, so
+            # skipping them keeps malformed conditions from aborting indexing
+            if join_type.upper() not in ("MANY_TO_ONE", "ONE_TO_MANY", "ONE_TO_ONE"):
+                continue
+
+            condition = relationship.get("condition", "")
+            if match := _CONDITION_PATTERN.match(condition):
+                fk_columns = [match[2], match[4]]
+            else:
+                fk_columns = [side.split(".")[1] for side in condition.split(" = ")]
+            parsed_relationship = {
+                "models": related_models,
+                "join_type": join_type.upper(),
+                "fk_columns": fk_columns,
+                "comment": f'-- {{"condition": {condition}, "joinType": {join_type}}}\n  ',
+            }
+            relationships_by_model[related_models[0]].append(parsed_relationship)
+            if related_models[1] != related_models[0]:
+                relationships_by_model[related_models[1]].append(parsed_relationship)
+
         for model in models:
             table_name = model["name"]
+            primary_key = model["primaryKey"]
             columns_ddl = []
             for column in model["columns"]:
                 if "relationship" not in column:
-                    if "properties" in column:
+                    # assemble the comment as bytes fragments so the utf-8 decode
+                    # happens once per column instead of once per fragment
+                    comment_parts = []
+                    if (properties := column.get("properties")) is not None:
                         column_properties = {
-                            "alias": column["properties"].pop("displayName", ""),
-                            "description": column["properties"].pop("description", ""),
+                            "alias": properties.pop("displayName", ""),
+                            "description": properties.pop("description", ""),
                         }
                         nested_cols = {
                             k: v
-                            for k, v in column["properties"].items()
+                            for k, v in properties.items()
                             if k.startswith("nested")
                         }
                         if nested_cols:
                             column_properties["nested_columns"] = nested_cols
-                        comment = (
-                            f"-- {orjson.dumps(column_properties).decode("utf-8")}\n  "
+                        comment_parts.append(
+                            b"-- "
+                            + orjson.dumps(column_properties, option=_DUMPS_OPTS)
+                            + b"\n  "
                         )
-                    else:
-                        comment = ""
-                    if "isCalculated" in column and column["isCalculated"]:
-                        comment = (
-                            comment
-                            + f"-- This column is a Calculated Field\n  -- column expression: {column["expression"]}\n  "
+                    if column.get("isCalculated"):
+                        comment_parts.append(
+                            f"-- This column is a Calculated Field\n  -- column expression: {column['expression']}\n  ".encode(
+                                "utf-8"
+                            )
                         )
-
+                    column_name = column["name"]
                     columns_ddl.append(
                         {
                             "type": "COLUMN",
-                            "comment": comment,
-                            "name": column["name"],
+                            "comment": b"".join(comment_parts).decode("utf-8"),
+                            "name": column_name,
                             "data_type": column["type"],
-                            "is_primary_key": column["name"] == model["primaryKey"],
+                            "is_primary_key": column_name == primary_key,
                         }
                     )
 
             # Add foreign key constraints based on relationships
-            for relationship in relationships:
-                condition = relationship.get("condition", "")
-                join_type = relationship.get("joinType", "")
-                models = relationship.get("models", [])
-
-                if len(models) == 2:
-                    comment = (
-                        f'-- {{"condition": {condition}, "joinType": {join_type}}}\n  '
+            for relationship in relationships_by_model.get(table_name, ()):
+                related_models = relationship["models"]
+                join_type = relationship["join_type"]
+                fk_columns = relationship["fk_columns"]
+
+                should_add_fk = False
+                if table_name == related_models[0] and join_type == "MANY_TO_ONE":
+                    related_table = related_models[1]
+                    fk_column = fk_columns[0]
+                    fk_constraint = f"FOREIGN KEY ({fk_column}) REFERENCES {related_table}({primary_keys_map[related_table]})"
+                    should_add_fk = True
+                elif table_name == related_models[1] and join_type == "ONE_TO_MANY":
+                    related_table = related_models[0]
+                    fk_column = fk_columns[1]
+                    fk_constraint = f"FOREIGN KEY ({fk_column}) REFERENCES {related_table}({primary_keys_map[related_table]})"
+                    should_add_fk = True
+                elif join_type == "ONE_TO_ONE":
+                    index = related_models.index(table_name)
+                    related_table = [m for m in related_models if m != table_name][0]
+                    fk_column = fk_columns[index]
+                    fk_constraint = f"FOREIGN KEY ({fk_column}) REFERENCES {related_table}({primary_keys_map[related_table]})"
+                    should_add_fk = True
+
+                if should_add_fk:
+                    columns_ddl.append(
+                        {
+                            "type": "FOREIGN_KEY",
+                            "comment": relationship["comment"],
+                            "constraint": fk_constraint,
+                            "tables": related_models,
+                        }
                     )
-                    should_add_fk = False
-                    if table_name == models[0] and join_type.upper() == "MANY_TO_ONE":
-                        related_table = models[1]
-                        fk_column = condition.split(" = ")[0].split(".")[1]
-                        fk_constraint = f"FOREIGN KEY ({fk_column}) REFERENCES {related_table}({primary_keys_map[related_table]})"
-                        should_add_fk = True
-                    elif table_name == models[1] and join_type.upper() == "ONE_TO_MANY":
-                        related_table = models[0]
-                        fk_column = condition.split(" = ")[1].split(".")[1]
-                        fk_constraint = f"FOREIGN KEY ({fk_column}) REFERENCES {related_table}({primary_keys_map[related_table]})"
-                        should_add_fk = True
-                    elif table_name in models and join_type.upper() == "ONE_TO_ONE":
-                        index = models.index(table_name)
-                        related_table = [m for m in models if m != table_name][0]
-                        fk_column = condition.split(" = ")[index].split(".")[1]
-                        fk_constraint = f"FOREIGN KEY ({fk_column}) REFERENCES {related_table}({primary_keys_map[related_table]})"
-                        should_add_fk = True
-
-                    if should_add_fk:
-                        columns_ddl.append(
-                            {
-                                "type": "FOREIGN_KEY",
-                                "comment": comment,
-                                "constraint": fk_constraint,
-                                "tables": models,
-                            }
-                        )
 
             if "properties" in model:
                 model_properties = {
                     "alias": model["properties"].pop("displayName", ""),
                     "description": model["properties"].pop("description", ""),
                 }
-                comment = f"\n/* {orjson.dumps(model_properties).decode("utf-8")} */\n"
+                comment = (
+                    b"\n/* "
+                    + orjson.dumps(model_properties, option=_DUMPS_OPTS)
+                    + b" */\n"
+                ).decode("utf-8")
             else:
                 comment = ""
 
@@ -333,7 +386,7 @@ class DDLConverter:
                     ),
                 }
             )
-            column_ddl_commands = [
+            ddl_commands.extend(
                 {
                     "name": table_name,
                     "payload": str(
@@ -344,8 +397,7 @@ class DDLConverter:
                     ),
                 }
                 for i in range(0, len(columns_ddl), column_indexing_batch_size)
-            ]
-            ddl_commands += column_ddl_commands
+            )
 
         return ddl_commands
 
@@ -381,7 +433,7 @@ class DDLConverter:
                 )
 
             for measure in metric.get("measure", []):
-                comment = f"-- This column is a measure\n  -- expression: {measure["expression"]}\n  "
+                comment = f"-- This column is a measure\n  -- expression: {measure['expression']}\n  "
                 name = measure.get("name", "")
                 columns_ddl.append(
                     {
@@ -392,7 +444,7 @@ class DDLConverter:
                     }
                 )
 
-            comment = f"\n/* This table is a metric */\n/* Metric Base Object: {metric["baseObject"]} */\n"
+            comment = f"\n/* This table is a metric */\n/* Metric Base Object: {metric['baseObject']} */\n"
             ddl_commands.append(
                 {
                     "name": table_name,
@@ -433,7 +485,7 @@ class TableDescriptionConverter:
                     ),
                     content=table_description,
                 )
-                for table_description in tqdm(
+                for table_description in _progress(
                     table_descriptions,
                     desc="indexing table descriptions into the table description store",
                 )
@@ -638,6 +690,8 @@ class Indexing(BasicPipeline):
                 [dbschema_store, view_store, table_description_store]
             ),
             "validator": MDLValidator(),
+            # a single embedder instance serves the dbschema, view and table
+            # description branches, sharing one client and connection pool
             "document_embedder": embedder_provider.get_document_embedder(),
             "ddl_converter": DDLConverter(),
             "table_description_converter": TableDescriptionConverter(),
@@ -660,6 +714,18 @@ class Indexing(BasicPipeline):
             "column_indexing_batch_size": column_indexing_batch_size,
         }
 
+        # embedded documents keyed by (project id, MDL digest): indexing is idempotent,
+        # so redeploys of an unchanged MDL can skip the convert and embed steps entirely
+        self._ddl_cache: Dict[Tuple[Optional[str], bytes], List[Document]] = LRUCache(
+            maxsize=100
+        )
+        self._view_cache: Dict[Tuple[Optional[str], bytes], List[Document]] = LRUCache(
+            maxsize=100
+        )
+        # digest of the last successfully indexed MDL per project: when it matches,
+        # the stores already hold exactly these documents and the run is a no-op
+        self._last_indexed_mdl: Dict[Optional[str], bytes] = LRUCache(maxsize=100)
+
         super().__init__(
             AsyncDriver({}, sys.modules[__name__], result_builder=base.DictResult())
         )
@@ -682,20 +748,155 @@ class Indexing(BasicPipeline):
             orient="LR",
         )
 
+    async def _index_dbschema(
+        self,
+        mdl: Dict[str, Any],
+        cache_key: Tuple[Optional[str], bytes],
+        id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        if (cached_documents := self._ddl_cache.get(cache_key)) is not None:
+            logger.info(
+                "Ask Indexing pipeline is reusing cached dbschema embeddings..."
+            )
+            return await write_dbschema(
+                embed_dbschema={"documents": cached_documents},
+                dbschema_writer=self._components["dbschema_writer"],
+            )
+
+        ddl_documents = convert_to_ddl(
+            mdl=mdl,
+            ddl_converter=self._components["ddl_converter"],
+            column_indexing_batch_size=self._configs["column_indexing_batch_size"],
+            id=id,
+        )["documents"]
+
+        # embed and write in slices: while one slice is being written, the next
+        # one is already embedding, so the two network stages overlap and only a
+        # slice of unwritten embedded documents is in flight at a time
+        embedded_documents: List[Document] = []
+        documents_written = 0
+        write_task = None
+        try:
+            for start in range(0, len(ddl_documents), _EMBED_WRITE_BATCH_SIZE):
+                embedded_batch = await embed_dbschema(
+                    convert_to_ddl={
+                        "documents": ddl_documents[
+                            start : start + _EMBED_WRITE_BATCH_SIZE
+                        ]
+                    },
+                    document_embedder=self._components["document_embedder"],
+                )
+                if write_task is not None:
+                    documents_written += (await write_task)["documents_written"]
+                write_task = asyncio.create_task(
+                    write_dbschema(
+                        embed_dbschema=embedded_batch,
+                        dbschema_writer=self._components["dbschema_writer"],
+                    )
+                )
+                embedded_documents.extend(embedded_batch["documents"])
+            if write_task is not None:
+                documents_written += (await write_task)["documents_written"]
+        except BaseException:
+            # don't abandon the in-flight write when embedding fails: it would
+            # keep writing concurrently with a retry's cleaner and surface its
+            # exception as never retrieved
+            if write_task is not None:
+                write_task.cancel()
+                await asyncio.gather(write_task, return_exceptions=True)
+            raise
+
+        self._ddl_cache[cache_key] = embedded_documents
+        return {"documents_written": documents_written}
+
+    async def _index_view(
+        self,
+        mdl: Dict[str, Any],
+        cache_key: Tuple[Optional[str], bytes],
+        id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        if (cached_documents := self._view_cache.get(cache_key)) is not None:
+            logger.info("Ask Indexing pipeline is reusing cached view embeddings...")
+            return await write_view(
+                embed_view={"documents": cached_documents},
+                view_writer=self._components["view_writer"],
+            )
+
+        view_documents = view_chunk(
+            mdl=mdl,
+            view_chunker=self._components["view_chunker"],
+            id=id,
+        )
+        embedded_documents = await embed_view(
+            view_chunk=view_documents,
+            document_embedder=self._components["document_embedder"],
+        )
+        self._view_cache[cache_key] = embedded_documents["documents"]
+        return await write_view(
+            embed_view=embedded_documents,
+            view_writer=self._components["view_writer"],
+        )
+
+    async def _index_table_descriptions(
+        self, mdl: Dict[str, Any], id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        table_description_documents = covert_to_table_descriptions(
+            mdl=mdl,
+            table_description_converter=self._components["table_description_converter"],
+            id=id,
+        )
+        embedded_documents = await embed_table_descriptions(
+            covert_to_table_descriptions=table_description_documents,
+            document_embedder=self._components["document_embedder"],
+        )
+        return await write_table_description(
+            embed_table_descriptions=embedded_documents,
+            table_description_writer=self._components["table_description_writer"],
+        )
+
     @async_timer
     @observe(name="Document Indexing")
     async def run(self, mdl_str: str, id: Optional[str] = None) -> Dict[str, Any]:
         logger.info("Document Indexing pipeline is running...")
-        return await self._pipe.execute(
-            ["write_dbschema", "write_view", "write_table_description"],
-            inputs={
-                "mdl_str": mdl_str,
-                "id": id,
-                **self._components,
-                **self._configs,
-            },
+
+        mdl = validate_mdl(
+            clean_document_store={"mdl": mdl_str},
+            validator=self._components["validator"],
+        )["mdl"]
+        mdl_digest = hashlib.blake2b(
+            orjson.dumps(mdl, option=_DUMPS_OPTS), digest_size=16
+        ).digest()
+        cache_key = (id, mdl_digest)
+
+        if self._last_indexed_mdl.get(id) == mdl_digest:
+            logger.info(
+                "Document Indexing pipeline is skipping indexing: MDL is unchanged..."
+            )
+            return {"skipped": True}
+
+        await clean_document_store(
+            mdl_str=mdl_str, cleaner=self._components["cleaner"], id=id
         )
 
+        # the dbschema, view and table description branches only depend on the validated MDL,
+        # so the embedder calls run concurrently instead of waiting on each other
+        dbschema_task = asyncio.create_task(self._index_dbschema(mdl, cache_key, id))
+        view_task = asyncio.create_task(self._index_view(mdl, cache_key, id))
+        table_description_task = asyncio.create_task(
+            self._index_table_descriptions(mdl, id)
+        )
+
+        write_dbschema, write_view, write_table_description = await asyncio.gather(
+            dbschema_task, view_task, table_description_task
+        )
+        self._last_indexed_mdl[id] = mdl_digest
+
+        return {
+            "write_dbschema": write_dbschema,
+            "write_view": write_view,
+            "write_table_description": write_table_description,
+        }
+
 
 if __name__ == "__main__":
     from langfuse.decorators import langfuse_context
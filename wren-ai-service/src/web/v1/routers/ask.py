@@ -2,6 +2,7 @@ import uuid
 from dataclasses import asdict
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 
 from src.globals import (
     ServiceContainer,
@@ -72,13 +73,13 @@ Note: The query processing is asynchronous, and status updates can be polled via
 """
 
 
-@router.post("/asks")
+@router.post("/asks", response_model=AskResponse)
 async def ask(
     ask_request: AskRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> AskResponse:
+) -> ORJSONResponse:
     query_id = str(uuid.uuid4())
     ask_request.query_id = query_id
     service_container.ask_service._ask_results[query_id] = AskResultResponse(
@@ -90,29 +91,31 @@ async def ask(
         ask_request,
         service_metadata=asdict(service_metadata),
     )
-    return AskResponse(query_id=query_id)
+    return ORJSONResponse(AskResponse(query_id=query_id).model_dump())
 
 
-@router.patch("/asks/{query_id}")
+@router.patch("/asks/{query_id}", response_model=StopAskResponse)
 async def stop_ask(
     query_id: str,
     stop_ask_request: StopAskRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> StopAskResponse:
+) -> ORJSONResponse:
     stop_ask_request.query_id = query_id
     background_tasks.add_task(
         service_container.ask_service.stop_ask,
         stop_ask_request,
     )
-    return StopAskResponse(query_id=query_id)
+    return ORJSONResponse(StopAskResponse(query_id=query_id).model_dump())
 
 
-@router.get("/asks/{query_id}/result")
+@router.get("/asks/{query_id}/result", response_model=AskResultResponse)
 async def get_ask_result(
     query_id: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> AskResultResponse:
-    return service_container.ask_service.get_ask_result(
-        AskResultRequest(query_id=query_id)
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        service_container.ask_service.get_ask_result(
+            AskResultRequest(query_id=query_id)
+        ).model_dump()
     )
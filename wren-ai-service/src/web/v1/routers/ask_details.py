@@ -2,6 +2,7 @@ import uuid
 from dataclasses import asdict
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 
 from src.globals import (
     ServiceContainer,
@@ -74,13 +75,13 @@ Note: The actual analysis is performed in the background using FastAPI's Backgro
 """
 
 
-@router.post("/ask-details")
+@router.post("/ask-details", response_model=AskDetailsResponse)
 async def ask_details(
     ask_details_request: AskDetailsRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> AskDetailsResponse:
+) -> ORJSONResponse:
     query_id = str(uuid.uuid4())
     ask_details_request.query_id = query_id
     service_container.ask_details_service._ask_details_results[
@@ -94,15 +95,16 @@ async def ask_details(
         ask_details_request,
         service_metadata=asdict(service_metadata),
     )
-    return AskDetailsResponse(query_id=query_id)
+    return ORJSONResponse(AskDetailsResponse(query_id=query_id).model_dump())
 
 
-@router.get("/ask-details/{query_id}/result")
+@router.get("/ask-details/{query_id}/result", response_model=AskDetailsResultResponse)
 async def get_ask_details_result(
     query_id: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> AskDetailsResultResponse:
-    return service_container.ask_details_service.get_ask_details_result(
-        AskDetailsResultRequest(query_id=query_id)
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        service_container.ask_details_service.get_ask_details_result(
+            AskDetailsResultRequest(query_id=query_id)
+        ).model_dump()
     )
-
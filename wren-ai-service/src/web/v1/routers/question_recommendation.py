@@ -3,6 +3,7 @@ from dataclasses import asdict
 from typing import Literal, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.globals import (
@@ -93,7 +94,7 @@ async def recommend(
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> PostResponse:
+) -> ORJSONResponse:
     id = str(uuid.uuid4())
     service = service_container.question_recommendation
 
@@ -112,7 +113,7 @@ async def recommend(
         service.recommend, input, service_metadata=asdict(service_metadata)
     )
 
-    return PostResponse(id=id)
+    return ORJSONResponse(PostResponse(id=id).model_dump())
 
 
 class GetResponse(BaseModel):
@@ -129,12 +130,14 @@ class GetResponse(BaseModel):
 async def get(
     id: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> GetResponse:
+) -> ORJSONResponse:
     resource = service_container.question_recommendation[id]
 
-    return GetResponse(
-        id=resource.id,
-        status=resource.status,
-        response=resource.response,
-        error=resource.error and resource.error.model_dump(),
+    return ORJSONResponse(
+        GetResponse(
+            id=resource.id,
+            status=resource.status,
+            response=resource.response,
+            error=resource.error and resource.error.model_dump(),
+        ).model_dump()
     )
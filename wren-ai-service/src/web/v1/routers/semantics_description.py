@@ -3,6 +3,7 @@ from dataclasses import asdict
 from typing import Literal, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.globals import (
@@ -100,7 +101,7 @@ async def generate(
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> PostResponse:
+) -> ORJSONResponse:
     id = str(uuid.uuid4())
     service = service_container.semantics_description
 
@@ -115,7 +116,7 @@ async def generate(
     background_tasks.add_task(
         service.generate, input, service_metadata=asdict(service_metadata)
     )
-    return PostResponse(id=id)
+    return ORJSONResponse(PostResponse(id=id).model_dump())
 
 
 class GetResponse(BaseModel):
@@ -132,7 +133,7 @@ class GetResponse(BaseModel):
 async def get(
     id: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> GetResponse:
+) -> ORJSONResponse:
     resource = service_container.semantics_description[id]
 
     def _formatter(response: Optional[dict]) -> Optional[list[dict]]:
@@ -154,9 +155,11 @@ async def get(
             for model_name, model_data in response.items()
         ]
 
-    return GetResponse(
-        id=resource.id,
-        status=resource.status,
-        response=resource.response and _formatter(resource.response),
-        error=resource.error and resource.error.model_dump(),
+    return ORJSONResponse(
+        GetResponse(
+            id=resource.id,
+            status=resource.status,
+            response=resource.response and _formatter(resource.response),
+            error=resource.error and resource.error.model_dump(),
+        ).model_dump()
     )
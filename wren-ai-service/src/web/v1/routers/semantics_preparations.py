@@ -2,6 +2,7 @@ import uuid
 from dataclasses import asdict
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 
 from src.globals import (
     ServiceContainer,
@@ -65,13 +66,13 @@ Note: The preparation process is handled in the background using FastAPI's Backg
 """
 
 
-@router.post("/semantics-preparations")
+@router.post("/semantics-preparations", response_model=SemanticsPreparationResponse)
 async def prepare_semantics(
     prepare_semantics_request: SemanticsPreparationRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> SemanticsPreparationResponse:
+) -> ORJSONResponse:
     service_container.semantics_preparation_service._prepare_semantics_statuses[
         prepare_semantics_request.mdl_hash
     ] = SemanticsPreparationStatusResponse(
@@ -83,16 +84,23 @@ async def prepare_semantics(
         prepare_semantics_request,
         service_metadata=asdict(service_metadata),
     )
-    return SemanticsPreparationResponse(mdl_hash=prepare_semantics_request.mdl_hash)
+    return ORJSONResponse(
+        SemanticsPreparationResponse(
+            mdl_hash=prepare_semantics_request.mdl_hash
+        ).model_dump()
+    )
 
 
-@router.get("/semantics-preparations/{mdl_hash}/status")
+@router.get(
+    "/semantics-preparations/{mdl_hash}/status",
+    response_model=SemanticsPreparationStatusResponse,
+)
 async def get_prepare_semantics_status(
     mdl_hash: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> SemanticsPreparationStatusResponse:
-    return service_container.semantics_preparation_service.get_prepare_semantics_status(
-        SemanticsPreparationStatusRequest(mdl_hash=mdl_hash)
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        service_container.semantics_preparation_service.get_prepare_semantics_status(
+            SemanticsPreparationStatusRequest(mdl_hash=mdl_hash)
+        ).model_dump()
     )
-
-
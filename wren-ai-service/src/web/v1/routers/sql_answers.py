@@ -2,6 +2,7 @@ import uuid
 from dataclasses import asdict
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 
 from src.globals import (
     ServiceContainer,
@@ -68,13 +69,13 @@ Note: The actual SQL processing is performed in the background using FastAPI's B
 """
 
 
-@router.post("/sql-answers")
+@router.post("/sql-answers", response_model=SqlAnswerResponse)
 async def sql_answer(
     sql_answer_request: SqlAnswerRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> SqlAnswerResponse:
+) -> ORJSONResponse:
     query_id = str(uuid.uuid4())
     sql_answer_request.query_id = query_id
     service_container.sql_answer_service._sql_answer_results[
@@ -88,14 +89,16 @@ async def sql_answer(
         sql_answer_request,
         service_metadata=asdict(service_metadata),
     )
-    return SqlAnswerResponse(query_id=query_id)
+    return ORJSONResponse(SqlAnswerResponse(query_id=query_id).model_dump())
 
 
-@router.get("/sql-answers/{query_id}/result")
+@router.get("/sql-answers/{query_id}/result", response_model=SqlAnswerResultResponse)
 async def get_sql_answer_result(
     query_id: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> SqlAnswerResultResponse:
-    return service_container.sql_answer_service.get_sql_answer_result(
-        SqlAnswerResultRequest(query_id=query_id)
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        service_container.sql_answer_service.get_sql_answer_result(
+            SqlAnswerResultRequest(query_id=query_id)
+        ).model_dump()
     )
@@ -2,6 +2,7 @@ import uuid
 from dataclasses import asdict
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 
 from src.globals import (
     ServiceContainer,
@@ -87,13 +88,13 @@ Note: The actual SQL expansion is performed in the background using FastAPI's Ba
 """
 
 
-@router.post("/sql-expansions")
+@router.post("/sql-expansions", response_model=SqlExpansionResponse)
 async def sql_expansion(
     sql_expansion_request: SqlExpansionRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> SqlExpansionResponse:
+) -> ORJSONResponse:
     query_id = str(uuid.uuid4())
     sql_expansion_request.query_id = query_id
     service_container.sql_expansion_service._sql_expansion_results[
@@ -107,29 +108,33 @@ async def sql_expansion(
         sql_expansion_request,
         service_metadata=asdict(service_metadata),
     )
-    return SqlExpansionResponse(query_id=query_id)
+    return ORJSONResponse(SqlExpansionResponse(query_id=query_id).model_dump())
 
 
-@router.patch("/sql-expansions/{query_id}")
+@router.patch("/sql-expansions/{query_id}", response_model=StopSqlExpansionResponse)
 async def stop_sql_expansion(
     query_id: str,
     stop_sql_expansion_request: StopSqlExpansionRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> StopSqlExpansionResponse:
+) -> ORJSONResponse:
     stop_sql_expansion_request.query_id = query_id
     background_tasks.add_task(
         service_container.sql_expansion_service.stop_sql_expansion,
         stop_sql_expansion_request,
     )
-    return StopSqlExpansionResponse(query_id=query_id)
+    return ORJSONResponse(StopSqlExpansionResponse(query_id=query_id).model_dump())
 
 
-@router.get("/sql-expansions/{query_id}/result")
+@router.get(
+    "/sql-expansions/{query_id}/result", response_model=SqlExpansionResultResponse
+)
 async def get_sql_expansion_result(
     query_id: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> SqlExpansionResultResponse:
-    return service_container.sql_expansion_service.get_sql_expansion_result(
-        SqlExpansionResultRequest(query_id=query_id)
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        service_container.sql_expansion_service.get_sql_expansion_result(
+            SqlExpansionResultRequest(query_id=query_id)
+        ).model_dump()
     )
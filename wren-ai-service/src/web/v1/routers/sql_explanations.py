@@ -2,6 +2,7 @@ import uuid
 from dataclasses import asdict
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 
 from src.globals import (
     ServiceContainer,
@@ -70,13 +71,13 @@ The SQL explanation generation is an asynchronous process. The POST endpoint ini
 """
 
 
-@router.post("/sql-explanations")
+@router.post("/sql-explanations", response_model=SQLExplanationResponse)
 async def sql_explanation(
     sql_explanation_request: SQLExplanationRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> SQLExplanationResponse:
+) -> ORJSONResponse:
     query_id = str(uuid.uuid4())
     sql_explanation_request.query_id = query_id
     service_container.sql_explanation_service._sql_explanation_results[
@@ -87,15 +88,18 @@ async def sql_explanation(
         sql_explanation_request,
         service_metadata=asdict(service_metadata),
     )
-    return SQLExplanationResponse(query_id=query_id)
+    return ORJSONResponse(SQLExplanationResponse(query_id=query_id).model_dump())
 
 
-@router.get("/sql-explanations/{query_id}/result")
+@router.get(
+    "/sql-explanations/{query_id}/result", response_model=SQLExplanationResultResponse
+)
 async def get_sql_explanation_result(
     query_id: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> SQLExplanationResultResponse:
-    return service_container.sql_explanation_service.get_sql_explanation_result(
-        SQLExplanationResultRequest(query_id=query_id)
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        service_container.sql_explanation_service.get_sql_explanation_result(
+            SQLExplanationResultRequest(query_id=query_id)
+        ).model_dump()
     )
-
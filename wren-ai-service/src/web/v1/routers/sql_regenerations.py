@@ -2,6 +2,7 @@ import uuid
 from dataclasses import asdict
 
 from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
 
 from src.globals import (
     ServiceContainer,
@@ -80,13 +81,14 @@ Usage:
 Note: The actual SQL generation occurs in the background using FastAPI's BackgroundTasks.
 """
 
-@router.post("/sql-regenerations")
+
+@router.post("/sql-regenerations", response_model=SQLRegenerationResponse)
 async def sql_regeneration(
     sql_regeneration_request: SQLRegenerationRequest,
     background_tasks: BackgroundTasks,
     service_container: ServiceContainer = Depends(get_service_container),
     service_metadata: ServiceMetadata = Depends(get_service_metadata),
-) -> SQLRegenerationResponse:
+) -> ORJSONResponse:
     query_id = str(uuid.uuid4())
     sql_regeneration_request.query_id = query_id
     service_container.sql_regeneration_service._sql_regeneration_results[
@@ -97,14 +99,18 @@ async def sql_regeneration(
         sql_regeneration_request,
         service_metadata=asdict(service_metadata),
     )
-    return SQLRegenerationResponse(query_id=query_id)
+    return ORJSONResponse(SQLRegenerationResponse(query_id=query_id).model_dump())
 
 
-@router.get("/sql-regenerations/{query_id}/result")
+@router.get(
+    "/sql-regenerations/{query_id}/result", response_model=SQLRegenerationResultResponse
+)
 async def get_sql_regeneration_result(
     query_id: str,
     service_container: ServiceContainer = Depends(get_service_container),
-) -> SQLRegenerationResultResponse:
-    return service_container.sql_regeneration_service.get_sql_regeneration_result(
-        SQLRegenerationResultRequest(query_id=query_id)
+) -> ORJSONResponse:
+    return ORJSONResponse(
+        service_container.sql_regeneration_service.get_sql_regeneration_result(
+            SQLRegenerationResultRequest(query_id=query_id)
+        ).model_dump()
     )
@@ -0,0 +1,86 @@
+from src.pipelines.indexing.indexing import DDLConverter
+
+
+def _mdl(relationships):
+    return {
+        "models": [
+            {
+                "name": "book",
+                "primaryKey": "id",
+                "columns": [{"name": "id", "type": "INT"}],
+            },
+            {
+                "name": "author",
+                "primaryKey": "id",
+                "columns": [{"name": "id", "type": "INT"}],
+            },
+        ],
+        "relationships": relationships,
+        "views": [],
+        "metrics": [],
+    }
+
+
+def test_canonical_condition_emits_foreign_key():
+    converter = DDLConverter()
+    mdl = _mdl(
+        [
+            {
+                "name": "book_author",
+                "models": ["book", "author"],
+                "joinType": "MANY_TO_ONE",
+                "condition": "book.author_id = author.id",
+            }
+        ]
+    )
+
+    ddl_commands = converter._get_ddl_commands(mdl, 50)
+    payloads = [command["payload"] for command in ddl_commands]
+    assert any(
+        "FOREIGN KEY (author_id) REFERENCES author(id)" in payload
+        for payload in payloads
+    )
+
+
+def test_non_canonical_condition_falls_back_to_split():
+    converter = DDLConverter()
+    # "author-id" is not a \w+ token, so the precompiled pattern rejects the
+    # condition and the split(" = ") fallback has to extract the columns
+    mdl = _mdl(
+        [
+            {
+                "name": "book_author",
+                "models": ["book", "author"],
+                "joinType": "MANY_TO_ONE",
+                "condition": "book.author-id = author.id",
+            }
+        ]
+    )
+
+    ddl_commands = converter._get_ddl_commands(mdl, 50)
+    payloads = [command["payload"] for command in ddl_commands]
+    assert any(
+        "FOREIGN KEY (author-id) REFERENCES author(id)" in payload
+        for payload in payloads
+    )
+
+
+def test_many_to_many_with_malformed_condition_is_skipped():
+    converter = DDLConverter()
+    mdl = _mdl(
+        [
+            {
+                "name": "book_author",
+                "models": ["book", "author"],
+                "joinType": "MANY_TO_MANY",
+                "condition": "",
+            }
+        ]
+    )
+
+    # MANY_TO_MANY never emits a FOREIGN KEY constraint, so a condition that
+    # doesn't fit the "table.column = table.column" shape must not be parsed
+    # (and must not abort the conversion)
+    ddl_commands = converter._get_ddl_commands(mdl, 50)
+    assert len(ddl_commands) == 4
+    assert not any("FOREIGN KEY" in command["payload"] for command in ddl_commands)
@@ -0,0 +1,225 @@
+import asyncio
+
+import orjson
+import pytest
+
+from src.pipelines.indexing.indexing import Indexing
+
+
+class _FakeEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    async def run(self, documents):
+        self.calls.append(len(documents))
+        return {"documents": list(documents)}
+
+
+class _FakeStore:
+    def __init__(self):
+        self.deletes = 0
+        self.writes = []
+
+    async def delete_documents(self, filters=None):
+        self.deletes += 1
+
+    async def write_documents(self, documents, policy=None):
+        self.writes.append(len(documents))
+        return len(documents)
+
+
+class _FakeDocumentStoreProvider:
+    def __init__(self):
+        self.stores = {}
+
+    def get_store(self, dataset_name: str = "default", **kwargs):
+        return self.stores.setdefault(dataset_name, _FakeStore())
+
+
+class _FakeEmbedderProvider:
+    def __init__(self, embedder):
+        self._embedder = embedder
+
+    def get_document_embedder(self):
+        return self._embedder
+
+
+def _build_pipeline():
+    embedder = _FakeEmbedder()
+    store_provider = _FakeDocumentStoreProvider()
+    pipeline = Indexing(
+        embedder_provider=_FakeEmbedderProvider(embedder),
+        document_store_provider=store_provider,
+    )
+    return pipeline, embedder, store_provider
+
+
+_MDL = {
+    "models": [
+        {
+            "name": "book",
+            "primaryKey": "id",
+            "columns": [
+                {"name": "id", "type": "INT"},
+                {"name": "title", "type": "VARCHAR"},
+            ],
+        }
+    ],
+    "views": [
+        {
+            "name": "book_view",
+            "statement": "SELECT * FROM book",
+            "properties": {"question": "How many books?", "viewId": "fake-id"},
+        }
+    ],
+    "relationships": [],
+    "metrics": [],
+}
+
+
+@pytest.mark.asyncio
+async def test_identical_mdl_skips_indexing():
+    pipeline, embedder, store_provider = _build_pipeline()
+    mdl_str = orjson.dumps(_MDL).decode()
+
+    first = await pipeline.run(mdl_str)
+    assert "skipped" not in first
+    embed_calls = len(embedder.calls)
+    deletes = store_provider.stores["default"].deletes
+
+    second = await pipeline.run(mdl_str)
+    assert second == {"skipped": True}
+    assert len(embedder.calls) == embed_calls
+    assert store_provider.stores["default"].deletes == deletes
+
+
+@pytest.mark.asyncio
+async def test_key_reordered_mdl_skips_indexing():
+    pipeline, embedder, _ = _build_pipeline()
+
+    await pipeline.run(orjson.dumps(_MDL).decode())
+    embed_calls = len(embedder.calls)
+
+    # same MDL with keys in a different insertion order hashes identically
+    # because the digest is computed with OPT_SORT_KEYS
+    reordered = {key: _MDL[key] for key in reversed(list(_MDL))}
+    assert await pipeline.run(orjson.dumps(reordered).decode()) == {"skipped": True}
+    assert len(embedder.calls) == embed_calls
+
+
+@pytest.mark.asyncio
+async def test_cached_embeddings_rewrite_after_different_mdl():
+    pipeline, embedder, store_provider = _build_pipeline()
+    mdl_str = orjson.dumps(_MDL).decode()
+    other_mdl = {**_MDL, "models": []}
+
+    await pipeline.run(mdl_str)
+    await pipeline.run(orjson.dumps(other_mdl).decode())
+    embed_calls = len(embedder.calls)
+    dbschema_writes = len(store_provider.stores["default"].writes)
+
+    # the first MDL is no longer the last indexed one, so the run must not
+    # skip — but its dbschema/view embeddings are cached, leaving only the
+    # table descriptions to re-embed
+    result = await pipeline.run(mdl_str)
+    assert "skipped" not in result
+    assert len(embedder.calls) == embed_calls + 1
+    assert len(store_provider.stores["default"].writes) > dbschema_writes
+
+
+@pytest.mark.asyncio
+async def test_skip_and_caches_are_isolated_per_project():
+    pipeline, embedder, _ = _build_pipeline()
+    mdl_str = orjson.dumps(_MDL).decode()
+
+    await pipeline.run(mdl_str, id="project-1")
+    embed_calls = len(embedder.calls)
+
+    # a different project with the same MDL gets its own cache entries
+    result = await pipeline.run(mdl_str, id="project-2")
+    assert "skipped" not in result
+    assert len(embedder.calls) > embed_calls
+
+    # while the first project's skip digest is untouched
+    assert await pipeline.run(mdl_str, id="project-1") == {"skipped": True}
+
+
+def _large_mdl(model_count: int):
+    # one column per model yields one TABLE and one TABLE_COLUMNS command each
+    return {
+        "models": [
+            {
+                "name": f"model_{index}",
+                "primaryKey": "id",
+                "columns": [{"name": "id", "type": "INT"}],
+            }
+            for index in range(model_count)
+        ],
+        "views": [],
+        "relationships": [],
+        "metrics": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_dbschema_embeds_and_writes_in_slices():
+    pipeline, embedder, store_provider = _build_pipeline()
+
+    # 90 models -> 180 ddl documents -> 64/64/52 embed-write slices
+    result = await pipeline.run(orjson.dumps(_large_mdl(90)).decode())
+    assert result["write_dbschema"] == {"documents_written": 180}
+    assert store_provider.stores["default"].writes == [64, 64, 52]
+    assert embedder.calls.count(64) == 2
+    assert embedder.calls.count(52) == 1
+
+    (cached_documents,) = pipeline._ddl_cache.values()
+    assert len(cached_documents) == 180
+
+
+class _FailingEmbedder:
+    def __init__(self, fail_on_call: int):
+        self._fail_on_call = fail_on_call
+        self.calls = 0
+
+    async def run(self, documents):
+        self.calls += 1
+        # yield to the event loop like a real network embedder, so the
+        # in-flight write gets a chance to start before the failure
+        await asyncio.sleep(0)
+        if self.calls == self._fail_on_call:
+            raise RuntimeError("embedding failed")
+        return {"documents": list(documents)}
+
+
+class _HangingStore(_FakeStore):
+    def __init__(self):
+        super().__init__()
+        self.cancelled = False
+
+    async def write_documents(self, documents, policy=None):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return len(documents)
+
+
+@pytest.mark.asyncio
+async def test_embed_failure_cancels_in_flight_write():
+    store_provider = _FakeDocumentStoreProvider()
+    store_provider.stores["default"] = _HangingStore()
+    pipeline = Indexing(
+        embedder_provider=_FakeEmbedderProvider(_FailingEmbedder(fail_on_call=2)),
+        document_store_provider=store_provider,
+    )
+    mdl = pipeline._components["validator"].run(orjson.dumps(_large_mdl(90)).decode())[
+        "mdl"
+    ]
+
+    # the second slice's embedding fails while the first slice is still being
+    # written; the pending write must be cancelled instead of abandoned
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        await pipeline._index_dbschema(mdl, cache_key=(None, b"digest"))
+    assert store_provider.stores["default"].cancelled
+    assert len(pipeline._ddl_cache) == 0